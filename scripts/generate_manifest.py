@@ -7,106 +7,788 @@ Fetches package information from GitHub API without installing Wenget
 """
 
 import os
+import io
 import sys
 import json
 import re
 import time
-from urllib.request import Request, urlopen
+import random
+import heapq
+import queue
+import asyncio
+import itertools
+import contextlib
+import contextvars
+import logging
+import threading
+import http.client
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlsplit
 from urllib.error import HTTPError, URLError
-from typing import Dict, List, Optional, Any
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+# Optional faster JSON backend, falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional multi-pattern matchers, used to match all platform patterns in one
+# scan. Both beat the stdlib regex; RE2 is preferred when both are installed,
+# since Hyperscan reports each match through a Python callback, which makes it
+# slower than RE2 on short asset names
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Optional HTTP/2 client, multiplexes concurrent requests over one connection
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 # Fix Windows console encoding
 if sys.platform == "win32":
-    import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+logger = logging.getLogger(__name__)
+
+# Records logged while fetching one source, printed later under its header;
+# None outside of _buffered()
+_log_buffer = contextvars.ContextVar("_log_buffer", default=None)
+
+
+class _SourceLogFilter(logging.Filter):
+    """
+    Hold back records logged while a source is fetched, so concurrent
+    fetches don't interleave; records with immediate=True (rate limit
+    pauses) are still shown as they happen
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        buffer = _log_buffer.get()
+        if buffer is None or getattr(record, "immediate", False):
+            return True
+        buffer.append(record)
+        return False
+
+
+logger.addFilter(_SourceLogFilter())
+
+
+async def _buffered(coro) -> Tuple[Any, List[logging.LogRecord]]:
+    """Await coro (in its own task), returning its result and its log records"""
+    records = []
+    _log_buffer.set(records)
+    return await coro, records
+
 # Configuration
 GITHUB_API_BASE = "https://api.github.com"
-RATE_LIMIT_DELAY = 1  # seconds between requests
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+MAX_CONCURRENCY = 8  # default number of concurrent requests in flight
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+MAX_REDIRECTS = 5
+RETRY_BASE_DELAY = 1  # seconds, doubled on each retry
+MAX_RETRY_DELAY = 60  # seconds
+RATE_LIMIT_THRESHOLD = 10  # pause all requests below this many remaining
+
+# Request priorities (lower goes first): cheap ETag revalidations, then
+# fresh fetches, then retries of failed requests
+PRIORITY_REVALIDATE = 0
+PRIORITY_FETCH = 1
+PRIORITY_RETRY = 2
+GRAPHQL_BATCH_SIZE = 25  # repositories per GraphQL query
+CACHE_FILE = ".manifest_cache.json"  # ETag cache, stored next to the manifest
+
+# owner/repo from a GitHub URL, ignoring ".git" and any trailing path
+GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+?)(?:\.git)?(?:/|$)")
+
+# Gist ID from a gist page or raw file URL
+GIST_URL_RE = re.compile(r"gist\.github(?:usercontent)?\.com/[^/]+/([a-f0-9]+)")
+
+# Script type by lowercase file extension
+SCRIPT_TYPES = {
+    ".ps1": "powershell",
+    ".sh": "bash",
+    ".bat": "batch",
+    ".cmd": "batch",
+    ".py": "python",
+}
+
+# Repository metadata and latest release assets, queried once per alias
+REPO_FIELDS_FRAGMENT = """
+fragment RepoFields on Repository {
+  name
+  description
+  url
+  homepageUrl
+  licenseInfo { spdxId }
+  latestRelease {
+    releaseAssets(first: 100) {
+      pageInfo { hasNextPage }
+      nodes { name downloadUrl size }
+    }
+  }
+}
+"""
+
+
+class AsyncRateLimiter:
+    """
+    Bounded request concurrency with prioritized waiters and a shared pause
+    for GitHub rate limits
+    """
+
+    def __init__(self, max_concurrency: int):
+        self._slots = max_concurrency
+        self._waiters = []  # heap of (priority, seq, future)
+        self._seq = itertools.count()
+        self._paused = False  # no slots are handed out while paused
+        self._resume_at = 0.0  # epoch before which no request is sent
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_FETCH):
+        """Hold one of the request slots; waits out any pause"""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int):
+        if self._slots > 0 and not self._waiters and not self._paused:
+            self._slots -= 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Hand the slot on if it was granted just before cancellation
+            if not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        self._slots += 1
+        self._wake()
+
+    def _wake(self):
+        """Hand free slots to the highest priority waiters, unless paused"""
+        while self._slots > 0 and self._waiters and not self._paused:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self._slots -= 1
+                future.set_result(None)
+
+    def pause_until(self, resume_at: float, reason: str):
+        """Hold back all requests until the given epoch"""
+        if resume_at <= self._resume_at:
+            return
+
+        self._resume_at = resume_at
+        delay = max(0, resume_at - time.time())
+        logger.info(
+            f"⏳ Rate limit: {reason}, pausing requests for {round(delay)}s",
+            extra={"immediate": True},
+        )
+
+        self._paused = True
+        asyncio.get_running_loop().call_later(delay, self._resume_if_due)
+
+    def _resume_if_due(self):
+        # A later pause_until() may have pushed the resume time back
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self._resume_if_due)
+        else:
+            self._paused = False
+            self._wake()
 
 
 class GitHubAPI:
     """Simple GitHub API client"""
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        cache_file: Optional[str] = None,
+        concurrency: int = MAX_CONCURRENCY,
+    ):
         self.token = token or os.environ.get("GITHUB_TOKEN")
-        self.rate_limit_remaining = None
+        self.concurrency = concurrency
+        self.rate_limit_remaining = None  # budget shared by most requests
         self.rate_limit_reset = None
-
-    def _make_request(self, url: str) -> Dict[str, Any]:
-        """Make HTTP request to GitHub API"""
-        headers = {
+        self._executor = None
+        self.limiter = None
+        self._local = threading.local()  # per-thread keep-alive connections
+        self._connections = []
+        self._proxies = getproxies()  # HTTP(S)_PROXY from the environment
+        self._client = None  # shared httpx client, when HTTP/2 is available
+
+        # Default request headers, built once and copied per request
+        self._headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "Wenget-Bucket-Generator/1.0",
         }
-
+        self._auth_headers = dict(self._headers)
         if self.token:
-            headers["Authorization"] = f"token {self.token}"
+            self._auth_headers["Authorization"] = f"token {self.token}"
 
-        req = Request(url, headers=headers)
+        # ETag cache: url -> {"etag": ..., "body": ...}
+        self.cache_file = cache_file
+        self._cache = {}
+        self._cache_used = set()
+        if cache_file and os.path.exists(cache_file):
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️  Ignoring unreadable cache {cache_file}: {e}")
+
+    def save_cache(self):
+        """Write ETag cache to disk, dropping entries not used in this run"""
+        if not self.cache_file:
+            return
+
+        cache = {url: self._cache[url] for url in self._cache_used if url in self._cache}
+        # Replace atomically, so an interrupted run keeps the old cache
+        temp_file = f"{self.cache_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(temp_file, self.cache_file)
+
+    async def __aenter__(self):
+        # Blocking HTTP calls run on a shared thread pool; the limiter
+        # bounds how many of them are in flight at once
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self.limiter = AsyncRateLimiter(self.concurrency)
+
+        if httpx is not None:
+            try:
+                self._client = httpx.Client(
+                    http2=True,
+                    timeout=30,
+                    limits=httpx.Limits(
+                        max_connections=self.concurrency,
+                        max_keepalive_connections=self.concurrency,
+                    ),
+                )
+            except ImportError:
+                # httpx without the h2 package, keep using http.client
+                self._client = None
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self.limiter = None
+
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+        for conn in self._connections:
+            conn.close()
+        self._connections = []
+        self._local = threading.local()
+
+    def _get_connection(self, scheme: str, host: str) -> http.client.HTTPConnection:
+        """Get the calling thread's persistent connection to host"""
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+
+        conn = connections.get((scheme, host))
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(host, timeout=30)
+            else:
+                conn = http.client.HTTPConnection(host, timeout=30)
+            connections[(scheme, host)] = conn
+            self._connections.append(conn)
+
+        return conn
+
+    def _send(
+        self, method: str, url: str, headers: Dict[str, str], data: Optional[bytes]
+    ) -> Tuple[int, str, Any, bytes]:
+        """
+        Send a request over a kept-alive connection
+        Returns the status, reason, headers and body
+        """
+        if self._client is not None:
+            try:
+                response = self._client.request(method, url, content=data, headers=headers)
+            except httpx.HTTPError as e:
+                raise URLError(e)
+            return response.status_code, response.reason_phrase, response.headers, response.content
+
+        parts = urlsplit(url)
+        if parts.scheme in self._proxies and not proxy_bypass(parts.hostname):
+            return self._send_via_proxy(method, url, headers, data)
+
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+        for attempt in range(2):
+            conn = self._get_connection(parts.scheme, parts.netloc)
+            reused = conn.sock is not None
 
-        for attempt in range(MAX_RETRIES):
             try:
-                with urlopen(req, timeout=30) as response:
-                    # Update rate limit info
-                    self.rate_limit_remaining = response.headers.get(
-                        "X-RateLimit-Remaining"
-                    )
-                    self.rate_limit_reset = response.headers.get("X-RateLimit-Reset")
+                conn.request(method, path, body=data, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                return response.status, response.reason, response.headers, body
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                # The server may have dropped an idle connection, retry once
+                if not reused or attempt:
+                    raise URLError(e)
+
+    def _send_via_proxy(
+        self, method: str, url: str, headers: Dict[str, str], data: Optional[bytes]
+    ) -> Tuple[int, str, Any, bytes]:
+        """Send a request through urllib, which handles the configured proxy"""
+        request = Request(url, data=data, headers=headers, method=method)
+        try:
+            with urlopen(request, timeout=30) as response:
+                return response.status, response.reason, response.headers, response.read()
+        except HTTPError as e:
+            return e.code, e.reason, e.headers, e.read()
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[bytes],
+        trim: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Perform a blocking request (runs on the executor)
+        Returns the response headers and the decoded body, reduced by trim
+        before it is cached
+        """
+        target = url
+        for _ in range(MAX_REDIRECTS):
+            status, reason, response_headers, body = self._send(method, target, headers, data)
+            location = response_headers.get("Location")
+            if status in (301, 302, 307, 308) and location:
+                target = urljoin(target, location)
+                continue
+            break
+
+        # Not modified since the cached response
+        if status == 304 and url in self._cache:
+            self._cache_used.add(url)
+            entry = self._cache[url]
+            if trim is not None:
+                # Older caches may hold the full body
+                entry["body"] = trim(entry["body"])
+            return response_headers, entry["body"]
+
+        if not 200 <= status < 300:
+            raise HTTPError(url, status, reason, response_headers, io.BytesIO(body))
+
+        result = orjson.loads(body) if orjson else json.loads(body.decode("utf-8"))
+        if trim is not None:
+            result = trim(result)
+
+        etag = response_headers.get("ETag")
+        if etag and method == "GET":
+            self._cache[url] = {"etag": etag, "body": result}
+            self._cache_used.add(url)
+
+        return response_headers, result
+
+    def _update_rate_limit(self, headers, authenticated: bool):
+        """
+        Record the shared budget's rate limit headers, and pause all requests
+        when it is nearly exhausted
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None:
+            return
+
+        # With a token, anonymous requests (gists) draw on a separate per-IP
+        # budget; running low there must not hold back the other requests
+        if authenticated != bool(self.token):
+            return
 
-                    data = json.loads(response.read().decode("utf-8"))
-                    return data
+        self.rate_limit_remaining = remaining
+        self.rate_limit_reset = reset
+
+        if reset and int(remaining) < RATE_LIMIT_THRESHOLD:
+            self.limiter.pause_until(float(reset), f"{remaining} requests remaining")
+
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with jitter, so retries don't arrive in bursts"""
+        return min(MAX_RETRY_DELAY, RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, 1))
+
+    @classmethod
+    def _retry_after_delay(cls, value: str, attempt: int) -> float:
+        """Seconds to wait from a Retry-After header (seconds or an HTTP date)"""
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return cls._backoff_delay(attempt)
+
+    async def _make_request(
+        self,
+        url: str,
+        authenticate: bool = True,
+        payload: Optional[Dict[str, Any]] = None,
+        trim: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make HTTP request to GitHub API (POST when payload is given)
+        trim keeps only the fields that are used from the response
+        """
+        headers = dict(self._auth_headers if authenticate else self._headers)
+
+        data = None
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+            data = json.dumps(payload).encode("utf-8")
+
+        priority = PRIORITY_FETCH
+        if payload is None and url in self._cache:
+            headers["If-None-Match"] = self._cache[url]["etag"]
+            priority = PRIORITY_REVALIDATE
+
+        method = "GET" if data is None else "POST"
+        loop = asyncio.get_running_loop()
+
+        # Requests on a budget other than the shared one wait on their own
+        # instead of pausing every request, and give up rather than wait long
+        authenticated = bool(self.token) and authenticate
+        shared = authenticated == bool(self.token)
+
+        async def wait_until(resume_at: float, reason: str) -> bool:
+            """Wait for the budget to recover; False if not worth waiting for"""
+            if shared:
+                self.limiter.pause_until(resume_at, reason)
+                return True
+            delay = max(0.0, resume_at - time.time())
+            if delay > MAX_RETRY_DELAY:
+                logger.warning(f"⚠️  Rate limit: {reason}, not waiting {round(delay)}s for {url}")
+                return False
+            if attempt < MAX_RETRIES - 1:
+                logger.info(
+                    f"⏳ Rate limit: {reason}, waiting {round(delay)}s for {url}",
+                    extra={"immediate": True},
+                )
+                await asyncio.sleep(delay)
+            return True
+
+        for attempt in range(MAX_RETRIES):
+            if attempt:
+                priority = PRIORITY_RETRY
+
+            try:
+                async with self.limiter.slot(priority):
+                    # Record rate limits before the slot is handed on, so a
+                    # pause holds back the requests already queued
+                    try:
+                        response_headers, result = await loop.run_in_executor(
+                            self._executor, self._fetch, method, url, headers, data, trim
+                        )
+                    except HTTPError as e:
+                        self._update_rate_limit(e.headers, authenticated)
+                        raise
+                    self._update_rate_limit(response_headers, authenticated)
+                return result
 
             except HTTPError as e:
-                if e.code == 403:
+                if e.code in (403, 429):
                     # Check if it's actually rate limit or permission issue
                     error_body = e.read().decode('utf-8') if hasattr(e, 'read') else ''
-                    if 'rate limit' in error_body.lower() or self.rate_limit_remaining == '0':
-                        print(f"⚠️  Rate limit exceeded. Remaining: {self.rate_limit_remaining}")
-                        print(f"   Waiting {RETRY_DELAY}s before retry...")
+                    retry_after = e.headers.get("Retry-After")
+                    # This response's own budget, not another request's
+                    remaining = e.headers.get("X-RateLimit-Remaining")
+                    reset = e.headers.get("X-RateLimit-Reset")
+                    if retry_after:
+                        # Secondary rate limit: wait exactly as instructed
+                        logger.warning(f"⚠️  Secondary rate limit hit: {url}")
+                        if not await wait_until(
+                            time.time() + self._retry_after_delay(retry_after, attempt), "Retry-After"
+                        ):
+                            raise
+                    elif (
+                        e.code == 429
+                        or 'rate limit' in error_body.lower()
+                        or remaining == '0'
+                    ):
+                        logger.warning(f"⚠️  Rate limit exceeded. Remaining: {remaining}")
+                        resume_at = float(reset) if reset else time.time() + self._backoff_delay(attempt)
+                        if not await wait_until(resume_at, "exhausted"):
+                            raise
                     else:
-                        print(f"⚠️  Permission denied (403): {url}")
-                        print(f"   This might be a private resource or authentication issue")
+                        logger.warning(f"⚠️  Permission denied (403): {url}")
+                        logger.warning(f"   This might be a private resource or authentication issue")
+                        if attempt < MAX_RETRIES - 1:
+                            await asyncio.sleep(self._backoff_delay(attempt))
 
-                    if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY)
-                    else:
+                    if attempt == MAX_RETRIES - 1:
                         raise
                 elif e.code == 404:
                     raise ValueError(f"Repository not found: {url}")
                 else:
-                    print(f"❌ HTTP Error {e.code}: {e.reason}")
+                    logger.error(f"❌ HTTP Error {e.code}: {e.reason}")
                     if attempt < MAX_RETRIES - 1:
-                        time.sleep(RETRY_DELAY)
+                        # 503s may say how long to wait
+                        retry_after = e.headers.get("Retry-After")
+                        if retry_after:
+                            await asyncio.sleep(self._retry_after_delay(retry_after, attempt))
+                        else:
+                            await asyncio.sleep(self._backoff_delay(attempt))
                     else:
                         raise
 
             except URLError as e:
-                print(f"❌ Network error: {e.reason}")
+                logger.error(f"❌ Network error: {e.reason}")
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(RETRY_DELAY)
+                    await asyncio.sleep(self._backoff_delay(attempt))
                 else:
                     raise
 
         raise Exception(f"Failed after {MAX_RETRIES} attempts")
 
-    def get_repo_info(self, owner: str, repo: str) -> Dict[str, Any]:
+    async def graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query and return the raw response (data and errors)"""
+        result = await self._make_request(
+            GITHUB_GRAPHQL_URL, payload={"query": query, "variables": variables}
+        )
+
+        if not result.get("data"):
+            messages = "; ".join(err.get("message", "") for err in result.get("errors", []))
+            raise ValueError(f"GraphQL error: {messages}")
+
+        return result
+
+    async def batch_repos(
+        self, pairs: List[Tuple[str, str]], batch_size: int = GRAPHQL_BATCH_SIZE
+    ) -> List[Any]:
+        """
+        Get repository information and latest release for many repositories
+        using aliased GraphQL queries (one request per batch)
+        Returns one entry per pair: a (repo_info, release) tuple shaped like
+        the REST responses, or the exception raised for that repository
+        """
+        it = iter(pairs)
+        batches = []
+        while True:
+            batch = list(itertools.islice(it, batch_size))
+            if not batch:
+                break
+            batches.append(batch)
+
+        results = await asyncio.gather(*(self._query_batch(batch) for batch in batches))
+        return [entry for batch_results in results for entry in batch_results]
+
+    async def _query_batch(self, pairs: List[Tuple[str, str]]) -> List[Any]:
+        """Query one batch of repositories, see batch_repos()"""
+        params = []
+        fields = []
+        variables = {}
+        for i, (owner, repo) in enumerate(pairs):
+            params.append(f"$o{i}: String!, $n{i}: String!")
+            fields.append(f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ ...RepoFields }}")
+            variables[f"o{i}"] = owner
+            variables[f"n{i}"] = repo
+
+        query = (
+            f"query({', '.join(params)}) {{\n  "
+            + "\n  ".join(fields)
+            + "\n}\n"
+            + REPO_FIELDS_FRAGMENT
+        )
+
+        try:
+            result = await self.graphql(query, variables)
+        except Exception as e:
+            return [e] * len(pairs)
+
+        # Errors are reported per alias (e.g. repository not found)
+        errors = {}
+        for err in result.get("errors", []):
+            path = err.get("path") or [None]
+            errors[path[0]] = err.get("message", "")
+
+        data = result["data"]
+        entries = []
+        for i, (owner, repo) in enumerate(pairs):
+            node = data.get(f"r{i}")
+            latest = node.get("latestRelease") if node else None
+            if latest and latest["releaseAssets"]["pageInfo"]["hasNextPage"]:
+                # Only the first page of assets came back; REST returns them all
+                entries.append(ValueError(f"{owner}/{repo} has more than 100 release assets"))
+            elif node:
+                entries.append(self._reshape_repo_node(node))
+            else:
+                message = errors.get(f"r{i}") or f"Repository not found: {owner}/{repo}"
+                entries.append(ValueError(message))
+
+        return entries
+
+    @staticmethod
+    def _reshape_repo_node(
+        node: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Reshape a GraphQL repository node like the REST responses"""
+        license_info = node.get("licenseInfo")
+        repo_info = {
+            "name": node["name"],
+            "description": node["description"],
+            "html_url": node["url"],
+            "homepage": node["homepageUrl"],
+            "license": {"spdx_id": license_info["spdxId"]} if license_info else None,
+        }
+
+        latest = node.get("latestRelease")
+        if not latest:
+            return repo_info, None
+
+        release = {
+            "assets": [
+                {
+                    "name": asset["name"],
+                    "browser_download_url": asset["downloadUrl"],
+                    "size": asset["size"],
+                }
+                for asset in latest["releaseAssets"]["nodes"]
+            ]
+        }
+
+        return repo_info, release
+
+    # REST responses carry far more than the manifest needs (uploader and
+    # owner objects per asset, file contents per gist). These keep only the
+    # fields that are read, in the same shape, so they can also be applied to
+    # an already trimmed body.
+
+    @staticmethod
+    def _trim_repo(repo_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the repository fields used for a package"""
+        license_info = repo_info.get("license")
+        return {
+            "name": repo_info["name"],
+            "description": repo_info.get("description"),
+            "html_url": repo_info["html_url"],
+            "homepage": repo_info.get("homepage"),
+            "license": {"spdx_id": license_info.get("spdx_id")} if license_info else None,
+        }
+
+    @staticmethod
+    def _trim_release(release: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the asset fields used for platforms"""
+        return {
+            "assets": [
+                {
+                    "name": asset["name"],
+                    "browser_download_url": asset["browser_download_url"],
+                    "size": asset["size"],
+                }
+                for asset in release.get("assets", ())
+            ],
+        }
+
+    @staticmethod
+    def _trim_gist(gist_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the gist fields used for scripts"""
+        return {
+            "description": gist_data.get("description"),
+            "html_url": gist_data["html_url"],
+            "files": {
+                filename: {"raw_url": file_info["raw_url"]}
+                for filename, file_info in gist_data.get("files", {}).items()
+            },
+        }
+
+    async def get_repo_info(self, owner: str, repo: str) -> Dict[str, Any]:
         """Get repository information"""
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}"
-        return self._make_request(url)
+        return await self._make_request(url, trim=self._trim_repo)
 
-    def get_latest_release(self, owner: str, repo: str) -> Dict[str, Any]:
+    async def get_latest_release(self, owner: str, repo: str) -> Dict[str, Any]:
         """Get latest release information"""
         url = f"{GITHUB_API_BASE}/repos/{owner}/{repo}/releases/latest"
-        return self._make_request(url)
+        return await self._make_request(url, trim=self._trim_release)
+
+    async def get_gist(self, gist_id: str) -> Dict[str, Any]:
+        """Get gist information (anonymous access)"""
+        # GITHUB_TOKEN from Actions doesn't have permission to access gists
+        url = f"{GITHUB_API_BASE}/gists/{gist_id}"
+        return await self._make_request(url, authenticate=False, trim=self._trim_gist)
 
     def check_rate_limit(self):
         """Print rate limit status"""
         if self.rate_limit_remaining:
-            print(f"ℹ️  Rate limit: {self.rate_limit_remaining} remaining")
+            logger.info(f"ℹ️  Rate limit: {self.rate_limit_remaining} remaining")
+
+
+def _compile_pattern_set(
+    pattern_lists: List[List[str]],
+) -> Optional[Callable[[str], Optional[int]]]:
+    """
+    Compile one multi-pattern entry per pattern list (index = list position)
+    Returns a function giving the lowest matching index for a string (None if
+    nothing matches), or None when neither RE2 nor Hyperscan is installed
+    """
+    expressions = ["|".join(patterns) for patterns in pattern_lists]
+
+    if re2 is not None:
+        pattern_set = re2.Set.SearchSet()
+        for expression in expressions:
+            pattern_set.Add(expression)
+        pattern_set.Compile()
+
+        def match(text: str) -> Optional[int]:
+            matches = pattern_set.Match(text)
+            return min(matches) if matches else None
+
+        return match
+
+    if hyperscan is not None:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[expression.encode("utf-8") for expression in expressions],
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+        )
+
+        def match(text: str) -> Optional[int]:
+            found = []
+            # Returning None from the handler keeps the scan going
+            database.scan(
+                text.encode("utf-8"),
+                match_event_handler=lambda pattern_id, *_: found.append(pattern_id),
+            )
+            return min(found) if found else None
+
+        return match
+
+    return None
 
 
 class PlatformDetector:
@@ -158,13 +840,7 @@ class PlatformDetector:
         ],
         "darwin-aarch64": [
             r"darwin.*aarch64|aarch64.*darwin|darwin.*arm64|macos.*arm64|osx.*arm64",
-            r"apple-darwin.*aarch64",
-        ],
-        "macos-x86_64": [
-            r"macos.*x86_64|osx.*x86_64",
-        ],
-        "macos-aarch64": [
-            r"macos.*aarch64|macos.*arm64|osx.*arm64",
+            r"apple-darwin.*aarch64|macos.*aarch64",
         ],
     }
 
@@ -182,16 +858,38 @@ class PlatformDetector:
         ],
     }
 
+    # Every pattern above requires one of these OS keywords
+    _OS_TOKENS = ("win", "linux", "darwin", "mac", "osx", "freebsd")
+    _OS_TOKEN_RE = re.compile("|".join(_OS_TOKENS))
+
     # Archive extensions (including standalone executables)
-    ARCHIVE_EXTENSIONS = [".tar.gz", ".tgz", ".zip", ".tar.xz", ".tar.bz2", ".exe"]
+    ARCHIVE_EXTENSIONS = (".tar.gz", ".tgz", ".zip", ".tar.xz", ".tar.bz2", ".exe")
+
+    # All platforms combined into one regex with a group per platform, exact
+    # patterns first. Each alternative is matched from the start and scans
+    # forward (.*?), so the first platform in this order that matches
+    # anywhere in the filename wins, the same as one search per platform.
+    _PLATFORM_ORDER = list(PATTERNS.items()) + list(FALLBACK_PATTERNS.items())
+    _EXACT_COUNT = len(PATTERNS)
+    _COMBINED = re.compile(
+        "|".join(f"(.*?(?:{'|'.join(patterns)}))" for _, patterns in _PLATFORM_ORDER)
+    )
+
+    # With RE2 or Hyperscan available, a pattern set reports every matching
+    # platform in a single pass; the lowest index has priority
+    _PATTERN_SET = _compile_pattern_set([patterns for _, patterns in _PLATFORM_ORDER])
 
     @classmethod
-    def get_linux_variant_priority(cls, filename: str) -> int:
+    def get_linux_variant_priority(
+        cls, filename: str, filename_lower: Optional[str] = None
+    ) -> int:
         """
         Get priority for Linux variants (higher number = higher priority)
         Priority: musl (3) > gnu (2) > no keyword (1)
+        filename_lower may be passed when the caller already lowercased it
         """
-        filename_lower = filename.lower()
+        if filename_lower is None:
+            filename_lower = filename.lower()
         if "musl" in filename_lower:
             return 3
         elif "gnu" in filename_lower:
@@ -200,120 +898,101 @@ class PlatformDetector:
             return 1
 
     @classmethod
-    def detect_platform(cls, filename: str) -> Optional[str]:
-        """Detect platform from filename with fallback support"""
-        filename_lower = filename.lower()
+    def detect_platform(cls, filename: str, filename_lower: Optional[str] = None) -> Optional[str]:
+        """
+        Detect platform from filename with fallback support
+        filename_lower may be passed when the caller already lowercased it
+        """
+        if filename_lower is None:
+            filename_lower = filename.lower()
 
         # Check if it's an archive
-        if not any(filename_lower.endswith(ext) for ext in cls.ARCHIVE_EXTENSIONS):
+        if not filename_lower.endswith(cls.ARCHIVE_EXTENSIONS):
             return None
 
-        # Priority 1: Try exact platform patterns (with architecture info)
-        for platform, patterns in cls.PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, filename_lower):
-                    return platform
+        # Skip assets without any OS keyword before running the regexes
+        if not cls._OS_TOKEN_RE.search(filename_lower):
+            return None
 
-        # Priority 2: Try fallback patterns (assume common architecture)
-        for platform, patterns in cls.FALLBACK_PATTERNS.items():
-            for pattern in patterns:
-                if re.search(pattern, filename_lower):
-                    print(f"   ⚠️  Fallback assumption: {filename} -> {platform}")
-                    return platform
+        # Priority 1: exact platform patterns (with architecture info)
+        # Priority 2: fallback patterns (assume common architecture)
+        if cls._PATTERN_SET is not None:
+            index = cls._PATTERN_SET(filename_lower)
+            if index is None:
+                return None
+        else:
+            match = cls._COMBINED.match(filename_lower)
+            if not match:
+                return None
 
-        return None
+            # Pattern groups are non-capturing, so group N is platform N
+            index = match.lastindex - 1
+        platform = cls._PLATFORM_ORDER[index][0]
+        if index >= cls._EXACT_COUNT:
+            logger.warning(f"   ⚠️  Fallback assumption: {filename} -> {platform}")
+
+        return platform
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to JSON with 2-space indentation, like json.dumps(indent=2)"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
 
 
 class ManifestGenerator:
     """Generate manifest.json from sources.txt"""
 
-    def __init__(self, github_token: Optional[str] = None):
-        self.api = GitHubAPI(github_token)
+    def __init__(
+        self,
+        github_token: Optional[str] = None,
+        cache_file: Optional[str] = None,
+        concurrency: int = MAX_CONCURRENCY,
+    ):
+        self.api = GitHubAPI(github_token, cache_file, concurrency)
         self.packages = []
         self.scripts = []
+        self.total_sources = 0
 
     def parse_github_url(self, url: str) -> Optional[tuple]:
         """Parse GitHub URL to extract owner and repo"""
-        patterns = [
-            r"github\.com/([^/]+)/([^/]+?)(?:\.git)?$",
-            r"github\.com/([^/]+)/([^/]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1), match.group(2)
+        match = GITHUB_URL_RE.search(url)
+        if match:
+            return match.group(1), match.group(2)
 
         return None
 
     def parse_gist_url(self, url: str) -> Optional[str]:
         """Parse Gist URL to extract gist ID"""
-        patterns = [
-            r"gist\.github\.com/[^/]+/([a-f0-9]+)",
-            r"gist\.githubusercontent\.com/[^/]+/([a-f0-9]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
+        match = GIST_URL_RE.search(url)
+        if match:
+            return match.group(1)
 
         return None
 
-    def detect_script_type(self, filename: str) -> Optional[str]:
-        """Detect script type from filename extension"""
-        ext_map = {
-            ".ps1": "powershell",
-            ".sh": "bash",
-            ".bat": "batch",
-            ".cmd": "batch",
-            ".py": "python",
-        }
-
-        for ext, script_type in ext_map.items():
-            if filename.lower().endswith(ext):
-                return script_type
-
-        return None
-
-    def fetch_gist_scripts(self, url: str) -> List[Dict[str, Any]]:
+    async def fetch_gist_scripts(self, url: str) -> List[Dict[str, Any]]:
         """Fetch script information from GitHub Gist"""
         gist_id = self.parse_gist_url(url)
         if not gist_id:
-            print(f"⚠️  Invalid Gist URL: {url}")
+            logger.warning(f"⚠️  Invalid Gist URL: {url}")
             return []
 
         try:
             # Get gist info (use anonymous access for public gists)
-            gist_url = f"{GITHUB_API_BASE}/gists/{gist_id}"
-
-            # Create a temporary API client without token for gist access
-            # GITHUB_TOKEN from Actions doesn't have permission to access gists
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "Wenget-Bucket-Generator/1.0",
-            }
-            req = Request(gist_url, headers=headers)
-
-            with urlopen(req, timeout=30) as response:
-                gist_data = json.loads(response.read().decode("utf-8"))
+            gist_data = await self.api.get_gist(gist_id)
 
             scripts = []
             files = gist_data.get("files", {})
 
             for filename, file_info in files.items():
-                script_type = self.detect_script_type(filename)
+                # Split once: the extension gives the type, the rest the name
+                name, ext = os.path.splitext(filename)
+                script_type = SCRIPT_TYPES.get(ext.lower())
                 if not script_type:
-                    print(f"   ⚠️  Skipping non-script file: {filename}")
+                    logger.warning(f"   ⚠️  Skipping non-script file: {filename}")
                     continue
 
-                # Remove extension from script name
-                name = filename
-                for ext in [".ps1", ".sh", ".bat", ".cmd", ".py"]:
-                    if name.endswith(ext):
-                        name = name[:-len(ext)]
-                        break
-
                 script = {
                     "name": name,
                     "description": gist_data.get("description") or f"{filename} from gist",
@@ -327,57 +1006,91 @@ class ManifestGenerator:
             return scripts
 
         except Exception as e:
-            print(f"❌ Error fetching gist {gist_id}: {e}")
+            logger.error(f"❌ Error fetching gist {gist_id}: {e}")
             return []
 
-    def fetch_package_info(self, url: str) -> Optional[Dict[str, Any]]:
-        """Fetch package information from GitHub"""
+    async def _fetch_repo_rest(
+        self, owner: str, repo: str
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Get repository info and latest release via the REST API"""
+        # Both requests are independent, so send them together
+        repo_info, release = await asyncio.gather(
+            self.api.get_repo_info(owner, repo),
+            self.api.get_latest_release(owner, repo),
+            return_exceptions=True,
+        )
+
+        if isinstance(repo_info, BaseException):
+            raise repo_info
+
+        if isinstance(release, BaseException):
+            logger.warning(f"⚠️  No releases found for {owner}/{repo}: {release}")
+            return repo_info, None
+
+        return repo_info, release
+
+    def extract_platforms(self, release: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract platform binaries from release assets"""
+        # Track platform info with priority for Linux variants
+        platforms = {}
+        platform_priorities = {}  # Track priority of selected assets
+        detect_platform = PlatformDetector.detect_platform
+        linux_priority = PlatformDetector.get_linux_variant_priority
+
+        for asset in release.get("assets", ()):
+            name = asset["name"]
+            name_lower = name.lower()
+            platform = detect_platform(name, name_lower)
+            if not platform:
+                continue
+
+            # For Linux platforms, only replace a lower-priority variant
+            if platform.startswith("linux-"):
+                current_priority = linux_priority(name, name_lower)
+                if current_priority <= platform_priorities.get(platform, 0):
+                    continue
+                platform_priorities[platform] = current_priority
+
+            # Build the entry only for assets that are kept
+            platforms[platform] = {
+                "url": asset["browser_download_url"],
+                "size": asset["size"],
+            }
+
+        return platforms
+
+    async def fetch_package_info(
+        self, url: str, prefetched: Any = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch package information from GitHub
+        prefetched is the batch_repos() entry for this URL, if any; REST is
+        used when it is missing or an exception
+        """
         parsed = self.parse_github_url(url)
         if not parsed:
-            print(f"⚠️  Invalid GitHub URL: {url}")
+            logger.warning(f"⚠️  Invalid GitHub URL: {url}")
             return None
 
         owner, repo = parsed
 
         try:
-            # Get repository info
-            repo_info = self.api.get_repo_info(owner, repo)
-
-            # Get latest release
-            try:
-                release = self.api.get_latest_release(owner, repo)
-            except Exception as e:
-                print(f"⚠️  No releases found for {owner}/{repo}: {e}")
+            if isinstance(prefetched, tuple):
+                repo_info, release = prefetched
+                if release is None:
+                    logger.warning(f"⚠️  No releases found for {owner}/{repo}")
+            else:
+                if prefetched is not None:
+                    logger.warning(f"⚠️  GraphQL result unusable for {owner}/{repo}, using REST: {prefetched}")
+                repo_info, release = await self._fetch_repo_rest(owner, repo)
+
+            if release is None:
                 return None
 
-            # Extract platform binaries from assets
-            # Track platform info with priority for Linux variants
-            platforms = {}
-            platform_priorities = {}  # Track priority of selected assets
-
-            for asset in release.get("assets", []):
-                platform = PlatformDetector.detect_platform(asset["name"])
-                if platform:
-                    asset_info = {
-                        "url": asset["browser_download_url"],
-                        "size": asset["size"],
-                    }
-
-                    # For Linux platforms, check priority
-                    if platform.startswith("linux-"):
-                        current_priority = PlatformDetector.get_linux_variant_priority(asset["name"])
-                        existing_priority = platform_priorities.get(platform, 0)
-
-                        # Only update if current asset has higher priority
-                        if current_priority > existing_priority:
-                            platforms[platform] = asset_info
-                            platform_priorities[platform] = current_priority
-                    else:
-                        # For non-Linux platforms, just use the asset
-                        platforms[platform] = asset_info
+            platforms = self.extract_platforms(release)
 
             if not platforms:
-                print(f"⚠️  No binary assets found for {owner}/{repo}")
+                logger.warning(f"⚠️  No binary assets found for {owner}/{repo}")
                 return None
 
             # Build package info
@@ -395,120 +1108,204 @@ class ManifestGenerator:
             return package
 
         except Exception as e:
-            print(f"❌ Error fetching {owner}/{repo}: {e}")
+            logger.error(f"❌ Error fetching {owner}/{repo}: {e}")
             return None
 
     def load_sources(self, sources_file: str) -> List[str]:
         """Load GitHub URLs from sources file"""
-        urls = []
-
         if not sources_file or not os.path.exists(sources_file):
-            return urls
+            return []
 
+        # Read and decode the whole file at once
         with open(sources_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith("#"):
-                    urls.append(line)
+            lines = f.read().splitlines()
 
-        return urls
+        # Skip empty lines and comments
+        return [line for line in map(str.strip, lines) if line and not line.startswith("#")]
 
-    def generate(self, sources_file: str, sources_scripts_file: str, output_file: str):
+    async def generate(self, sources_file: str, sources_scripts_file: str, output_file: str):
         """Generate manifest.json from sources files"""
-        print("🚀 Wenget Bucket Manifest Generator")
-        print("=" * 50)
+        logger.info("🚀 Wenget Bucket Manifest Generator")
+        logger.info("=" * 50)
+
+        async with self.api:
+            await self._fetch_all(sources_file, sources_scripts_file)
+
+        self._save(output_file)
+        self.api.save_cache()
+
+    async def _fetch_all(self, sources_file: str, sources_scripts_file: str):
+        """Fetch scripts and packages concurrently"""
 
         # Load script sources FIRST (to avoid rate limit issues)
-        print(f"\n📖 Loading script sources from {sources_scripts_file}...")
+        logger.info(f"\n📖 Loading script sources from {sources_scripts_file}...")
         gist_urls = self.load_sources(sources_scripts_file)
-        print(f"✓ Found {len(gist_urls)} gists")
+        logger.info(f"✓ Found {len(gist_urls)} gists")
 
         # Fetch script info FIRST
         if gist_urls:
-            print(f"\n📜 Fetching script information...")
-            for i, url in enumerate(gist_urls, 1):
-                print(f"\n[{i}/{len(gist_urls)}] {url}")
+            logger.info(f"\n📜 Fetching script information...")
+            # Each fetch's messages are printed under its header
+            results = await asyncio.gather(
+                *(_buffered(self.fetch_gist_scripts(url)) for url in gist_urls)
+            )
+            for i, (url, (scripts, records)) in enumerate(zip(gist_urls, results), 1):
+                logger.info(f"\n[{i}/{len(gist_urls)}] {url}")
+                for record in records:
+                    logger.handle(record)
 
-                scripts = self.fetch_gist_scripts(url)
                 if scripts:
                     self.scripts.extend(scripts)
                     for script in scripts:
-                        print(f"   ✓ {script['name']} ({script['script_type']})")
+                        logger.info(f"   ✓ {script['name']} ({script['script_type']})")
 
-                # Rate limiting
-                if i < len(gist_urls):
-                    time.sleep(RATE_LIMIT_DELAY)
-
-                # Show rate limit status periodically
-                if i % 10 == 0:
-                    self.api.check_rate_limit()
+            self.api.check_rate_limit()
 
         # Load package sources AFTER scripts
-        print(f"\n📖 Loading package sources from {sources_file}...")
+        logger.info(f"\n📖 Loading package sources from {sources_file}...")
         urls = self.load_sources(sources_file)
-        print(f"✓ Found {len(urls)} repositories")
+        self.total_sources = len(urls)
+        logger.info(f"✓ Found {len(urls)} repositories")
 
         # Fetch package info
-        print(f"\n📦 Fetching package information...")
-        for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] {url}")
+        logger.info(f"\n📦 Fetching package information...")
+        prefetched = await self._prefetch_packages(urls)
+        results = await asyncio.gather(
+            *(_buffered(self.fetch_package_info(url, prefetched.get(url))) for url in urls)
+        )
+        for i, (url, (package, records)) in enumerate(zip(urls, results), 1):
+            logger.info(f"\n[{i}/{len(urls)}] {url}")
+            for record in records:
+                logger.handle(record)
 
-            package = self.fetch_package_info(url)
             if package:
                 self.packages.append(package)
-                print(f"   ✓ {package['name']} - {len(package['platforms'])} platforms")
+                logger.info(f"   ✓ {package['name']} - {len(package['platforms'])} platforms")
+
+        self.api.check_rate_limit()
+
+    async def _prefetch_packages(self, urls: List[str]) -> Dict[str, Any]:
+        """Batch-fetch repositories via GraphQL, keyed by source URL"""
+        # GraphQL API requires authentication
+        if not self.api.token:
+            return {}
 
-            # Rate limiting
-            if i < len(urls):
-                time.sleep(RATE_LIMIT_DELAY)
+        parsed = {url: self.parse_github_url(url) for url in urls}
+        valid = [url for url in urls if parsed[url]]
+        entries = await self.api.batch_repos([parsed[url] for url in valid])
 
-            # Show rate limit status periodically
-            if i % 10 == 0:
-                self.api.check_rate_limit()
+        return dict(zip(valid, entries))
 
+    @staticmethod
+    def _write_manifest(f, sections: List[Tuple[str, Any]]):
+        """
+        Write the manifest object one list entry at a time instead of
+        serializing it as a whole; the output is the same as json.dump
+        with indent=2
+        """
+        f.write("{\n")
+        for i, (key, value) in enumerate(sections):
+            if i:
+                f.write(",\n")
+            f.write(f"  {_dumps(key)}: ")
+
+            if isinstance(value, list) and value:
+                f.write("[\n")
+                for j, item in enumerate(value):
+                    if j:
+                        f.write(",\n")
+                    # Strings never contain raw newlines, so this only
+                    # indents the entry's own lines
+                    f.write("    " + _dumps(item).replace("\n", "\n    "))
+                f.write("\n  ]")
+            else:
+                f.write(_dumps(value))
+        f.write("\n}")
+
+    def _save(self, output_file: str):
+        """Write manifest and print summary"""
         # Save manifest
-        print(f"\n💾 Saving manifest to {output_file}...")
-        manifest_obj = {
-            "packages": self.packages,
-            "last_updated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-        }
+        logger.info(f"\n💾 Saving manifest to {output_file}...")
+        sections = [
+            ("packages", self.packages),
+            ("last_updated", time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())),
+        ]
 
         # Add scripts if any
         if self.scripts:
-            manifest_obj["scripts"] = self.scripts
+            sections.append(("scripts", self.scripts))
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(manifest_obj, f, indent=2, ensure_ascii=False)
+        # Write to a temporary file and rename it over the manifest, so the
+        # manifest is never left half-written
+        tmp_file = f"{output_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            self._write_manifest(f, sections)
+        os.replace(tmp_file, output_file)
 
         # Summary
-        print("\n" + "=" * 50)
-        print("✅ Generation complete!")
-        print(f"   Total packages: {len(self.packages)}/{len(urls)}")
-        print(f"   Total scripts: {len(self.scripts)}")
-        print(f"   Output file: {output_file}")
+        logger.info("\n" + "=" * 50)
+        logger.info("✅ Generation complete!")
+        logger.info(f"   Total packages: {len(self.packages)}/{self.total_sources}")
+        logger.info(f"   Total scripts: {len(self.scripts)}")
+        logger.info(f"   Output file: {output_file}")
 
         # Platform statistics
-        platform_stats = {}
-        for pkg in self.packages:
-            for platform in pkg["platforms"].keys():
-                platform_stats[platform] = platform_stats.get(platform, 0) + 1
+        platform_stats = Counter(
+            platform for pkg in self.packages for platform in pkg["platforms"]
+        )
 
         if platform_stats:
-            print("\n📊 Platform coverage:")
+            logger.info("\n📊 Platform coverage:")
             for platform, count in sorted(platform_stats.items()):
-                print(f"   {platform}: {count} packages")
+                logger.info(f"   {platform}: {count} packages")
 
         # Script type statistics
         if self.scripts:
-            script_type_stats = {}
-            for script in self.scripts:
-                script_type = script["script_type"]
-                script_type_stats[script_type] = script_type_stats.get(script_type, 0) + 1
+            script_type_stats = Counter(script["script_type"] for script in self.scripts)
 
-            print("\n📜 Script types:")
+            logger.info("\n📜 Script types:")
             for script_type, count in sorted(script_type_stats.items()):
-                print(f"   {script_type}: {count} scripts")
+                logger.info(f"   {script_type}: {count} scripts")
+
+
+def setup_logging() -> QueueListener:
+    """
+    Route log output through a queue so that writing to stdout never
+    blocks request handling; returns the started listener
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.Queue()
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def run_async(coro) -> Any:
+    """Run a coroutine to completion, on uvloop's faster event loop when installed"""
+    uvloop = None
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    # uvloop.install() is deprecated; pass the loop factory instead
+    if hasattr(asyncio, "Runner"):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    # Python < 3.11: the event loop policy is the only hook
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
 
 
 def main():
@@ -541,27 +1338,49 @@ def main():
         "--token",
         help="GitHub personal access token (or use GITHUB_TOKEN env var)",
     )
+    parser.add_argument(
+        "-j",
+        "--concurrency",
+        type=int,
+        default=MAX_CONCURRENCY,
+        help=f"Maximum concurrent GitHub requests (default: {MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--cache-file",
+        help=f"HTTP response cache file (default: {CACHE_FILE} next to the output)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the HTTP response cache",
+    )
 
     args = parser.parse_args()
 
-    # Check if sources file exists
-    if not os.path.exists(args.sources):
-        print(f"❌ Error: Source file '{args.sources}' not found")
-        sys.exit(1)
-
-    # Generate manifest
+    listener = setup_logging()
     try:
-        generator = ManifestGenerator(args.token)
-        generator.generate(args.sources, args.scripts, args.output)
-    except KeyboardInterrupt:
-        print("\n\n⚠️  Generation interrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n❌ Fatal error: {e}")
-        import traceback
-
-        traceback.print_exc()
-        sys.exit(1)
+        # Check if sources file exists
+        if not os.path.exists(args.sources):
+            logger.error(f"❌ Error: Source file '{args.sources}' not found")
+            sys.exit(1)
+
+        # Generate manifest
+        try:
+            if args.no_cache:
+                cache_file = None
+            else:
+                cache_file = args.cache_file or os.path.join(os.path.dirname(args.output), CACHE_FILE)
+            generator = ManifestGenerator(args.token, cache_file, max(1, args.concurrency))
+            run_async(generator.generate(args.sources, args.scripts, args.output))
+        except KeyboardInterrupt:
+            logger.warning("\n\n⚠️  Generation interrupted by user")
+            sys.exit(1)
+        except Exception as e:
+            logger.exception(f"\n❌ Fatal error: {e}")
+            sys.exit(1)
+    finally:
+        # Flush queued log records
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -7,8 +7,15 @@ Validates manifest.json format and content
 
 import json
 import sys
+from collections import Counter
 from typing import Dict, List, Any
 
+# Optional faster JSON backend, falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ManifestValidator:
     """Validate manifest.json structure and content"""
@@ -49,8 +56,12 @@ class ManifestValidator:
     def _load_manifest(self) -> bool:
         """Load and parse manifest file (support object with packages/last_updated)"""
         try:
-            with open(self.manifest_file, "r", encoding="utf-8") as f:
-                manifest_obj = json.load(f)
+            if orjson:
+                with open(self.manifest_file, "rb") as f:
+                    manifest_obj = orjson.loads(f.read())
+            else:
+                with open(self.manifest_file, "r", encoding="utf-8") as f:
+                    manifest_obj = json.load(f)
             print(f"✓ Loaded {self.manifest_file}")
             if isinstance(manifest_obj, dict):
                 if "packages" in manifest_obj:
@@ -188,8 +199,8 @@ class ManifestValidator:
 
     def _check_duplicates(self):
         """Check for duplicate package names"""
-        names = [pkg.get("name") for pkg in self.packages if "name" in pkg]
-        duplicates = set([name for name in names if names.count(name) > 1])
+        counts = Counter(pkg["name"] for pkg in self.packages if "name" in pkg)
+        duplicates = [name for name, count in counts.items() if count > 1]
 
         for dup in duplicates:
             self.errors.append(f"Duplicate package name: {dup}")